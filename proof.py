@@ -6,25 +6,61 @@ A technical document for evaluating the typeface using DrawBot.
 Generates a multi-page PDF with various proofing layouts.
 
 Usage:
-    python proof.py [font_path] [output_path]
+    python proof.py [--fast] [font_path] [output_path]
 
-Defaults to fonts/VirtuaGrotesk-Regular.ttf and proof.pdf
+Defaults to fonts/VirtuaGrotesk-Regular.ttf and proof.pdf. With --fast,
+line-fit checks use hmtx advance widths instead of shaping text.
 """
 
+import argparse
 import drawBot as db
 from fontTools.ttLib import TTFont
+from bisect import bisect_right
+from functools import lru_cache
+from io import BytesIO
+from itertools import accumulate
 from pathlib import Path
+import os
 import sys
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+try:
+    import pikepdf
+except ImportError:  # pages are rendered sequentially instead
+    pikepdf = None
 
 # Page settings
 PAGE_WIDTH, PAGE_HEIGHT = 612, 792  # US Letter
 MARGIN = 36  # 0.5 inch margins
 
+# Character Set grid settings
+GRID_COLS = 12
+GRID_CELL_SIZE = (PAGE_WIDTH - 2 * MARGIN) / GRID_COLS
+GRID_Y_START = PAGE_HEIGHT - MARGIN - 50
+GRID_PER_PAGE = GRID_COLS * int((GRID_Y_START - MARGIN) // GRID_CELL_SIZE)
+
+# Timestamp shared by every page of a run
+RUN_TIME = datetime.now()
+RUN_DATE = RUN_TIME.strftime("%Y-%m-%d")
+
+
+@dataclass
+class FontContext:
+    """The data the proof pages need from a font, read in one pass."""
+
+    info: dict
+    codepoints: list
+
 
-def get_font_info(font_path):
-    """Extract font metadata using fontTools."""
-    tt = TTFont(font_path)
+def read_font(tt, fast=False):
+    """Read metadata and codepoints from an open font.
+
+    In fast mode the metadata also includes per-codepoint advance widths
+    from hmtx, used by fit_width in place of shaping text. The caller
+    owns tt and closes it when done.
+    """
     name_table = tt['name']
 
     info = {
@@ -44,52 +80,89 @@ def get_font_info(font_path):
         elif record.nameID == 9:
             info['designer'] = record.toUnicode()
 
+    # Font name as shown in page headers
+    info['header'] = f"{info['family']} {info['style']}"
+
     # Get glyph count
-    info['glyph_count'] = len(tt.getGlyphOrder())
+    info['glyph_count'] = tt['maxp'].numGlyphs
 
     # Get units per em
     info['upm'] = tt['head'].unitsPerEm
 
-    tt.close()
-    return info
+    # Get mapped codepoints. fontTools fills the subtable dict in the
+    # order its ranges are stored, which the spec requires to be
+    # ascending, so no sort pass is needed; a font with unsorted
+    # segments will produce an unsorted grid.
+    cmap = tt.getBestCmap() or {}
+    codepoints = list(cmap)
+
+    # Get advance widths in font units
+    if fast:
+        hmtx = tt['hmtx']
+        info['advances'] = {cp: hmtx[name][0] for cp, name in cmap.items()}
+
+    return FontContext(info=info, codepoints=codepoints)
+
+
+@lru_cache(maxsize=8192)
+def text_width(font, size, text):
+    """Measure text width, memoized per (font, size, text).
+
+    Measures a standalone FormattedString, so the current graphics
+    state is left untouched.
+    """
+    return db.textSize(db.FormattedString(text, font=font, fontSize=size))[0]
+
+
+@lru_cache(maxsize=None)
+def label_string(text, size, fill):
+    """Return a Helvetica FormattedString for header and footer text.
+
+    Headers and footers repeat on every page, so their strings are
+    built once and reused instead of setting font and fill per page.
+    """
+    return db.FormattedString(text, font="Helvetica", fontSize=size, fill=fill)
+
+
+@lru_cache(maxsize=None)
+def label_width(text, size, fill):
+    """Measure a cached label string without touching the graphics state."""
+    return db.textSize(label_string(text, size, fill))[0]
+
+
+def fast_text_width(advances, upm, text, size):
+    """Approximate text width from advance widths, ignoring kerning."""
+    return sum(advances.get(ord(ch), 0) for ch in text) * size / upm
+
 
+def fit_width(font_path, font_info, size, text):
+    """Measure text for line-fit checks.
 
-def get_cmap(font_path):
-    """Get character map from font."""
-    tt = TTFont(font_path)
-    cmap = tt.getBestCmap()
-    tt.close()
-    return cmap
+    Uses hmtx advances when font_info carries them (--fast), otherwise
+    shapes the text with DrawBot.
+    """
+    advances = font_info.get('advances')
+    if advances is None:
+        return text_width(font_path, size, text)
+    return fast_text_width(advances, font_info['upm'], text, size)
 
 
-def draw_header(font_info, page_title):
+def draw_header(header_text, page_title):
     """Draw page header with font name and page title."""
-    db.save()
-    db.font("Helvetica", 9)
-    db.fill(0.4)
+    header_y = PAGE_HEIGHT - MARGIN + 10
 
     # Left: Font name
-    header_text = f"{font_info['family']} {font_info['style']}"
-    db.text(header_text, (MARGIN, PAGE_HEIGHT - MARGIN + 10))
+    db.text(label_string(header_text, 9, 0.4), (MARGIN, header_y))
 
     # Right: Page title
-    title_width = db.textSize(page_title)[0]
-    db.text(page_title, (PAGE_WIDTH - MARGIN - title_width, PAGE_HEIGHT - MARGIN + 10))
-
-    db.restore()
+    title_width = label_width(page_title, 9, 0.4)
+    db.text(label_string(page_title, 9, 0.4), (PAGE_WIDTH - MARGIN - title_width, header_y))
 
 
 def draw_footer():
     """Draw page footer with date."""
-    db.save()
-    db.font("Helvetica", 8)
-    db.fill(0.5)
-
     # Left: Date
-    date_str = datetime.now().strftime("%Y-%m-%d")
-    db.text(date_str, (MARGIN, MARGIN - 20))
-
-    db.restore()
+    db.text(label_string(RUN_DATE, 8, 0.5), (MARGIN, MARGIN - 20))
 
 
 def title_page(font_path, font_info):
@@ -134,7 +207,7 @@ def title_page(font_path, font_info):
         f"Version: {font_info['version']}",
         f"Glyphs: {font_info['glyph_count']}",
         f"Units per Em: {font_info['upm']}",
-        f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}",
+        f"Generated: {RUN_TIME.strftime('%Y-%m-%d %H:%M')}",
     ]
 
     if font_info['designer']:
@@ -148,7 +221,7 @@ def title_page(font_path, font_info):
 def alphabet_page(font_path, font_info):
     """Full alphabet display in multiple sizes."""
     db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Alphabet")
+    draw_header(font_info['header'], "Alphabet")
     draw_footer()
 
     y = PAGE_HEIGHT - MARGIN - 40
@@ -163,7 +236,7 @@ def alphabet_page(font_path, font_info):
         db.fill(0)
 
         # Check if uppercase fits
-        uc_width = db.textSize(uppercase)[0]
+        uc_width = fit_width(font_path, font_info, size, uppercase)
         if uc_width > PAGE_WIDTH - 2 * MARGIN:
             # Split into two lines
             mid = len(uppercase) // 2
@@ -176,7 +249,7 @@ def alphabet_page(font_path, font_info):
         y -= size * 1.3
 
         # Lowercase
-        lc_width = db.textSize(lowercase)[0]
+        lc_width = fit_width(font_path, font_info, size, lowercase)
         if lc_width > PAGE_WIDTH - 2 * MARGIN:
             mid = len(lowercase) // 2
             db.text(lowercase[:mid], (MARGIN, y))
@@ -191,10 +264,32 @@ def alphabet_page(font_path, font_info):
             break
 
 
+def draw_text_lines(lines, tabs=None):
+    """Draw pre-positioned lines at the left margin, one db.text per line.
+
+    Each line is a (baseline_y, runs) pair, where runs is a list of
+    (text, font, size, fill) tuples set as one FormattedString. Lines
+    are drawn separately because a multi-line string would place each
+    baseline from its line's descent, not at the given y.
+    """
+    for y, runs in lines:
+        fs = db.FormattedString()
+        if tabs:
+            fs.tabs(*tabs)
+
+        for text, font, size, fill in runs:
+            fs.font(font)
+            fs.fontSize(size)
+            fs.fill(fill)
+            fs.append(text)
+
+        db.text(fs, (MARGIN, y))
+
+
 def numerals_page(font_path, font_info):
     """Numbers and punctuation."""
     db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Numerals & Punctuation")
+    draw_header(font_info['header'], "Numerals & Punctuation")
     draw_footer()
 
     y = PAGE_HEIGHT - MARGIN - 50
@@ -229,7 +324,7 @@ def numerals_page(font_path, font_info):
         db.fill(0)
 
         # Split if too long
-        if db.textSize(punctuation)[0] > PAGE_WIDTH - 2 * MARGIN:
+        if fit_width(font_path, font_info, size, punctuation) > PAGE_WIDTH - 2 * MARGIN:
             mid = len(punctuation) // 2
             db.text(punctuation[:mid], (MARGIN, y))
             y -= size * 1.3
@@ -245,7 +340,7 @@ def numerals_page(font_path, font_info):
 def waterfall_page(font_path, font_info):
     """Size waterfall with sample text."""
     db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Size Waterfall")
+    draw_header(font_info['header'], "Size Waterfall")
     draw_footer()
 
     y = PAGE_HEIGHT - MARGIN - 40
@@ -253,59 +348,62 @@ def waterfall_page(font_path, font_info):
     sample = "Hamburgefontsiv"
     sizes = [72, 60, 48, 36, 30, 24, 20, 18, 16, 14, 12, 11, 10, 9, 8, 7, 6]
 
-    for size in sizes:
-        db.font(font_path, size)
-        db.fill(0)
-
-        # Size label
-        db.save()
-        db.font("Helvetica", 8)
-        db.fill(0.5)
-        db.text(f"{size}pt", (MARGIN, y))
-        db.restore()
+    lines = []
 
-        # Sample text
-        db.font(font_path, size)
-        db.fill(0)
-        db.text(sample, (MARGIN + 40, y))
+    for size in sizes:
+        # Size label, then sample text at the tab stop
+        lines.append((y, [
+            (f"{size}pt\t", "Helvetica", 8, 0.5),
+            (sample, font_path, size, 0),
+        ]))
 
         y -= size * 1.4
 
         if y < MARGIN + 20:
             break
 
+    draw_text_lines(lines, tabs=[(40, "left")])
+
 
 def spacing_page(font_path, font_info):
     """Spacing proof with letter combinations."""
     db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Spacing Proof")
+    draw_header(font_info['header'], "Spacing Proof")
     draw_footer()
 
     y = PAGE_HEIGHT - MARGIN - 40
     size = 14
     line_height = size * 1.4
 
+    max_width = PAGE_WIDTH - 2 * MARGIN
+
     db.font(font_path, size)
     db.fill(0)
 
     # Lowercase spacing
     lowercase = "abcdefghijklmnopqrstuvwxyz"
 
+    # Per-character advances; kerning is ignored when truncating lines
+    advances = {ch: fit_width(font_path, font_info, size, ch) for ch in lowercase}
+
     for c in lowercase:
-        line = c + c.join(list(lowercase)) + c
+        line = f"{c}{c.join(lowercase)}{c}"
 
         # Check if line fits
-        if db.textSize(line)[0] > PAGE_WIDTH - 2 * MARGIN:
-            # Truncate
-            while db.textSize(line)[0] > PAGE_WIDTH - 2 * MARGIN and len(line) > 10:
-                line = line[:-2]
+        if fit_width(font_path, font_info, size, line) > max_width:
+            # Truncate to the longest fitting prefix, in steps of two
+            # characters so the line still ends on the spacing letter
+            prefix_widths = list(accumulate(advances[ch] for ch in line))
+            fit = bisect_right(prefix_widths, max_width)
+            fit -= (len(line) - fit) % 2
+            line = line[:max(fit, 10 - len(line) % 2)]
 
         db.text(line, (MARGIN, y))
         y -= line_height
 
         if y < MARGIN + 30:
             db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-            draw_header(font_info, "Spacing Proof (continued)")
+            draw_header(font_info['header'], "Spacing Proof (continued)")
             draw_footer()
             y = PAGE_HEIGHT - MARGIN - 40
 
@@ -313,7 +411,7 @@ def spacing_page(font_path, font_info):
 def paragraph_page(font_path, font_info):
     """Paragraph text at various sizes."""
     db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Paragraph Setting")
+    draw_header(font_info['header'], "Paragraph Setting")
     draw_footer()
 
     y = PAGE_HEIGHT - MARGIN - 40
@@ -347,7 +445,7 @@ def paragraph_page(font_path, font_info):
 def kerning_page(font_path, font_info):
     """Common kerning pairs."""
     db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Kerning Pairs")
+    draw_header(font_info['header'], "Kerning Pairs")
     draw_footer()
 
     y = PAGE_HEIGHT - MARGIN - 50
@@ -375,97 +473,90 @@ def kerning_page(font_path, font_info):
             break
 
 
-def glyph_set_page(font_path, font_info, cmap, start_page=1):
+def glyph_set_page(font_path, font_info, codepoints, start_page=1):
     """Display all glyphs in a grid."""
-    db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Character Set")
-    draw_footer()
-
     # Grid settings
-    cols = 12
-    cell_size = (PAGE_WIDTH - 2 * MARGIN) / cols
+    cols = GRID_COLS
+    cell_size = GRID_CELL_SIZE
     glyph_size = cell_size * 0.6
 
     x_start = MARGIN
-    y_start = PAGE_HEIGHT - MARGIN - 50
+    y_start = GRID_Y_START
 
-    x = x_start
-    y = y_start
+    per_page = GRID_PER_PAGE
 
-    # Sort codepoints
-    codepoints = sorted(cmap.keys())
+    # Lay out cell positions first, split into pages
+    pages = []
 
-    page_num = start_page
+    for first in range(0, max(len(codepoints), 1), per_page):
+        cells = []
+        for i, cp in enumerate(codepoints[first:first + per_page]):
+            row, col = divmod(i, cols)
+            cells.append((x_start + col * cell_size, y_start - row * cell_size, cp))
+        pages.append(cells)
 
-    for i, cp in enumerate(codepoints):
-        char = chr(cp)
+    page_num = start_page - 1
 
-        # Draw cell
+    for cells in pages:
+        page_num += 1
+        db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
+        if page_num == 1:
+            draw_header(font_info['header'], "Character Set")
+        else:
+            draw_header(font_info['header'], f"Character Set (page {page_num})")
+        draw_footer()
+
+        # Draw cells
         db.save()
         db.stroke(0.85)
         db.strokeWidth(0.5)
         db.fill(None)
-        db.rect(x, y - cell_size, cell_size, cell_size)
+        for x, y, _ in cells:
+            db.rect(x, y - cell_size, cell_size, cell_size)
         db.restore()
 
-        # Draw glyph
+        # Draw glyphs, centered in cells
         db.save()
         db.font(font_path, glyph_size)
         db.fill(0)
-
-        # Center glyph in cell
-        char_width = db.textSize(char)[0]
-        char_x = x + (cell_size - char_width) / 2
-        char_y = y - cell_size + cell_size * 0.25
-
-        db.text(char, (char_x, char_y))
+        for x, y, cp in cells:
+            char_x = x + (cell_size - text_width(font_path, glyph_size, chr(cp))) / 2
+            char_y = y - cell_size + cell_size * 0.25
+            db.text(chr(cp), (char_x, char_y))
         db.restore()
 
-        # Draw unicode label
+        # Draw unicode labels
         db.save()
         db.font("Helvetica", 5)
         db.fill(0.6)
-        label = f"{cp:04X}"
-        db.text(label, (x + 2, y - cell_size + 3))
+        for x, y, cp in cells:
+            db.text(f"{cp:04X}", (x + 2, y - cell_size + 3))
         db.restore()
 
-        # Move to next cell
-        x += cell_size
+    return page_num
 
-        if x + cell_size > PAGE_WIDTH - MARGIN:
-            x = x_start
-            y -= cell_size
 
-            if y - cell_size < MARGIN:
-                page_num += 1
-                db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-                draw_header(font_info, f"Character Set (page {page_num})")
-                draw_footer()
-                x = x_start
-                y = y_start
+def get_arabic_chars(codepoints):
+    """Return the font's Arabic characters in codepoint order."""
+    arabic_cps = sorted(set(codepoints).intersection(range(0x0600, 0x06FF)))
+    return "".join(map(chr, arabic_cps))
 
-    return page_num
 
-
-def arabic_page(font_path, font_info, cmap):
+def arabic_page(font_path, font_info, arabic_chars):
     """Arabic character display if present."""
-    # Check if font has Arabic
-    arabic_range = range(0x0600, 0x06FF)
-    arabic_chars = [chr(cp) for cp in arabic_range if cp in cmap]
-
     if not arabic_chars:
         return
 
     db.newPage(PAGE_WIDTH, PAGE_HEIGHT)
-    draw_header(font_info, "Arabic")
+    draw_header(font_info['header'], "Arabic")
     draw_footer()
 
     y = PAGE_HEIGHT - MARGIN - 50
 
     # Sample Arabic text
     samples = [
-        "".join(arabic_chars[:28]),
-        "".join(arabic_chars[28:56]) if len(arabic_chars) > 28 else "",
+        arabic_chars[:28],
+        arabic_chars[28:56] if len(arabic_chars) > 28 else "",
     ]
 
     sizes = [48, 36, 24, 18]
@@ -485,45 +576,137 @@ def arabic_page(font_path, font_info, cmap):
             break
 
 
-def generate_proof(font_path, output_path):
-    """Generate complete proof document."""
-    font_path = Path(font_path).resolve()
-    output_path = Path(output_path).resolve()
+def init_worker(run_time):
+    """Share the parent's run timestamp with a worker process."""
+    global RUN_TIME, RUN_DATE
+    RUN_TIME = run_time
+    RUN_DATE = run_time.strftime("%Y-%m-%d")
 
-    if not font_path.exists():
-        print(f"Error: Font not found at {font_path}")
-        return False
 
-    print(f"Generating proof for: {font_path.name}")
+def render_sections(sections):
+    """Render proof sections into their own drawing and return the PDF bytes."""
+    db.newDrawing()
+    for section, args in sections:
+        section(*args)
 
-    # Get font info
-    font_info = get_font_info(str(font_path))
-    cmap = get_cmap(str(font_path))
+    pdf_bytes = b""
+    if db.pageCount():
+        pdf_bytes = bytes(db.pdfImage().dataRepresentation())
+
+    db.endDrawing()
+    return pdf_bytes
+
+
+def render_proof(ctx, fp, output_path):
+    """Render every proof section for a font context and save the PDF.
+
+    Returns the number of pages written.
+    """
+    font_info = ctx.info
+    arabic_chars = get_arabic_chars(ctx.codepoints)
 
     print(f"  Family: {font_info['family']}")
     print(f"  Style: {font_info['style']}")
     print(f"  Glyphs: {font_info['glyph_count']}")
 
-    # Start document
-    db.newDrawing()
+    # Proof sections in document order; each may add one or more pages.
+    # The Character Set grid sits between them and is drawn separately
+    # so it can be split across processes.
+    front_sections = [
+        (title_page, (fp, font_info)),
+        (alphabet_page, (fp, font_info)),
+        (numerals_page, (fp, font_info)),
+        (waterfall_page, (fp, font_info)),
+        (spacing_page, (fp, font_info)),
+        (paragraph_page, (fp, font_info)),
+        (kerning_page, (fp, font_info)),
+    ]
+    back_sections = [
+        (arabic_page, (fp, font_info, arabic_chars)),
+    ]
+
+    codepoints = ctx.codepoints
+    grid_pages = max(1, -(-len(codepoints) // GRID_PER_PAGE))
 
     # Generate pages
     print("  Creating pages...")
 
-    title_page(str(font_path), font_info)
-    alphabet_page(str(font_path), font_info)
-    numerals_page(str(font_path), font_info)
-    waterfall_page(str(font_path), font_info)
-    spacing_page(str(font_path), font_info)
-    paragraph_page(str(font_path), font_info)
-    kerning_page(str(font_path), font_info)
-    glyph_set_page(str(font_path), font_info, cmap)
-    arabic_page(str(font_path), font_info, cmap)
-
-    # Save PDF
-    total_pages = db.pageCount()
-    db.saveImage(str(output_path))
-    db.endDrawing()
+    if pikepdf is None or grid_pages < 2:
+        # Without pikepdf to merge documents, or with a single grid page,
+        # draw everything in one document
+        db.newDrawing()
+        for section, args in front_sections:
+            section(*args)
+        glyph_set_page(fp, font_info, codepoints)
+        for section, args in back_sections:
+            section(*args)
+
+        total_pages = db.pageCount()
+        db.saveImage(str(output_path))
+        db.endDrawing()
+    else:
+        # Split the grid into runs of whole pages, one per worker
+        workers = min(os.cpu_count() or 1, grid_pages)
+        chunk = -(-grid_pages // workers) * GRID_PER_PAGE
+        grid_chunks = [
+            [(glyph_set_page, (fp, font_info, codepoints[first:first + chunk], 1 + first // GRID_PER_PAGE))]
+            for first in range(0, len(codepoints), chunk)
+        ]
+
+        with ProcessPoolExecutor(
+            max_workers=len(grid_chunks), initializer=init_worker, initargs=(RUN_TIME,)
+        ) as pool:
+            futures = [pool.submit(render_sections, grid_chunk) for grid_chunk in grid_chunks]
+
+            # The remaining sections are drawn here while the workers run
+            front_pdf = render_sections(front_sections)
+            back_pdf = render_sections(back_sections)
+
+            section_pdfs = [front_pdf, *(future.result() for future in futures), back_pdf]
+
+        # Section documents must stay open until the merged proof is saved
+        parts = [pikepdf.Pdf.open(BytesIO(pdf_bytes)) for pdf_bytes in section_pdfs if pdf_bytes]
+
+        try:
+            with pikepdf.Pdf.new() as proof:
+                for part in parts:
+                    proof.pages.extend(part.pages)
+
+                # Saving to a path lets qpdf write the file natively
+                total_pages = len(proof.pages)
+                proof.save(str(output_path))
+        finally:
+            for part in parts:
+                part.close()
+
+    return total_pages
+
+
+def generate_proof(font_path, output_path, fast=False):
+    """Generate complete proof document.
+
+    With fast=True, line-fit checks use hmtx advance widths instead of
+    shaping text, trading kerning accuracy for speed.
+    """
+    font_path = Path(font_path).resolve()
+    output_path = Path(output_path).resolve()
+
+    if not font_path.exists():
+        print(f"Error: Font not found at {font_path}")
+        return False
+
+    print(f"Generating proof for: {font_path.name}")
+
+    fp = str(font_path)
+
+    # Read everything the pages need in one pass, then close the font
+    tt = TTFont(fp, lazy=True)
+    try:
+        ctx = read_font(tt, fast=fast)
+    finally:
+        tt.close()
+
+    total_pages = render_proof(ctx, fp, output_path)
 
     print(f"  Saved: {output_path}")
     print(f"  Pages: {total_pages}")
@@ -538,9 +721,16 @@ if __name__ == "__main__":
     default_output = script_dir / "proof.pdf"
 
     # Parse arguments
-    font_path = sys.argv[1] if len(sys.argv) > 1 else default_font
-    output_path = sys.argv[2] if len(sys.argv) > 2 else default_output
+    parser = argparse.ArgumentParser(description="Generate a multi-page PDF proof of a font.")
+    parser.add_argument("font_path", nargs="?", default=default_font)
+    parser.add_argument("output_path", nargs="?", default=default_output)
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="fit lines using hmtx advance widths instead of shaping text",
+    )
+    args = parser.parse_args()
 
     # Generate proof
-    success = generate_proof(font_path, output_path)
+    success = generate_proof(args.font_path, args.output_path, fast=args.fast)
     sys.exit(0 if success else 1)